@@ -7,12 +7,24 @@ Demo script for fetching, processing, and visualizing cryptocurrency data
 import pandas as pd
 import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import copy
+import orjson
+import hashlib
 import matplotlib.pyplot as plt
 import seaborn as sns
+import pyarrow as pa
+import pyarrow.parquet as pq
 from datetime import datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import time
 import os
+import asyncio
+import httpx
+import diskcache
 from pathlib import Path
 
 # Configuration
@@ -20,20 +32,149 @@ BASE_URL = 'https://pro-api.coinmarketcap.com/v1/cryptocurrency/listings/latest'
 # Note: For demo purposes, we'll use a sandbox URL if the API key doesn't work
 SANDBOX_URL = 'https://sandbox-api.coinmarketcap.com/v1/cryptocurrency/listings/latest'
 
+# Response cache lifetimes (seconds) for each tier
+CACHE_TTL = {
+    'short': 60,      # fast-moving quotes
+    'normal': 300,    # rankings, metadata lists
+    'long': 3600,     # static reference data
+}
+# Cache tier used for each endpoint, matched on the end of the URL
+ENDPOINT_CACHE_TIERS = {
+    'listings/latest': 'short',
+}
+
+# Fields kept from each listing entry and from its USD quote
+LISTING_FIELDS = ('id', 'name', 'symbol', 'slug', 'cmc_rank')
+QUOTE_FIELDS = (
+    'price',
+    'percent_change_1h',
+    'percent_change_24h',
+    'percent_change_7d',
+    'percent_change_30d',
+    'percent_change_60d',
+    'percent_change_90d',
+    'market_cap',
+    'volume_24h'
+)
+
+# Compact column dtypes. Quotes have few significant digits so float32 is
+# enough; market cap and volume exceed float32's exact range (2**24).
+# Integer fields use pandas nullable types so a missing id or rank is NA.
+COLUMN_DTYPES = {
+    'id': 'Int32',
+    'cmc_rank': 'Int16',
+    'quote.USD.price': 'float32',
+    'quote.USD.percent_change_1h': 'float32',
+    'quote.USD.percent_change_24h': 'float32',
+    'quote.USD.percent_change_7d': 'float32',
+    'quote.USD.percent_change_30d': 'float32',
+    'quote.USD.percent_change_60d': 'float32',
+    'quote.USD.percent_change_90d': 'float32',
+    'quote.USD.market_cap': 'float64',
+    'quote.USD.volume_24h': 'float64',
+}
+
+# Numpy storage of the nullable integer columns; the append buffer keeps a
+# null mask alongside each of them
+MASKED_INT_DTYPES = {'id': 'int32', 'cmc_rank': 'int16'}
+
+# Listing fields holding text. The append buffer stores them as integer
+# codes into a growing category list, so self.df gets them as categoricals
+# without converting any strings.
+STRING_FIELDS = ('name', 'symbol', 'slug')
+
+# Columns of the pre-allocated append buffer, in output column order.
+# Timestamps are dictionary-encoded: each row stores the id of its batch.
+BUFFER_DTYPES = {
+    **{field: MASKED_INT_DTYPES.get(field, 'int8') for field in LISTING_FIELDS},
+    **{f'quote.USD.{field}': COLUMN_DTYPES[f'quote.USD.{field}'] for field in QUOTE_FIELDS},
+    'batch_id': 'int32',
+}
+
+# Arrow schema for the pandas-free streaming writer, matching process_data output
+PARQUET_SCHEMA = pa.schema(
+    [(col, pa.string() if col in STRING_FIELDS else pa.from_numpy_dtype(np.dtype(dtype)))
+     for col, dtype in BUFFER_DTYPES.items() if col != 'batch_id']
+    + [('timestamp', pa.timestamp('ns'))]
+)
+
+# Mock listings served when the API is unreachable:
+# (id, name, symbol, slug, market_cap, volume_24h), in rank order
+_MOCK_COINS = (
+    (1, 'Bitcoin', 'BTC', 'bitcoin', 800000000000, 25000000000),
+    (2, 'Ethereum', 'ETH', 'ethereum', 400000000000, 15000000000),
+    (3, 'Tether', 'USDT', 'tether', 90000000000, 50000000000),
+)
+_MOCK_BASE_PRICES = np.array([45000.50, 3200.75, 1.00])
+_MOCK_PRICE_STDS = np.array([1000, 200, 0.01])
+# Percent-change noise per quote field, as (Bitcoin, Ethereum, Tether) std devs
+_MOCK_PCT_STDS = {
+    'percent_change_1h': (2, 2, 0.1),
+    'percent_change_24h': (5, 5, 0.2),
+    'percent_change_7d': (10, 10, 0.3),
+    'percent_change_30d': (15, 15, 0.5),
+    'percent_change_60d': (20, 20, 0.7),
+    'percent_change_90d': (25, 25, 1.0),
+}
+_MOCK_STDS = np.array(list(_MOCK_PCT_STDS.values())).T  # one row per coin
+_MOCK_MEANS = np.zeros_like(_MOCK_STDS)
+
+# Percent-change columns used for trend analysis, in time period order
+TREND_COLS = (
+    'quote.USD.percent_change_1h',
+    'quote.USD.percent_change_24h',
+    'quote.USD.percent_change_7d',
+    'quote.USD.percent_change_30d',
+    'quote.USD.percent_change_60d',
+    'quote.USD.percent_change_90d'
+)
+# Short label for each trend column, e.g. '24h'
+TREND_LABELS = {col: col.rsplit('_', 1)[1] for col in TREND_COLS}
+
 class CryptoPipeline:
-    def __init__(self, api_key=None, use_sandbox=False):
+    def __init__(self, api_key=None, use_sandbox=False, cache_dir='.crypto_cache', cache_ttl=None,
+                 max_records=1000):
         """
         Initialize the cryptocurrency data pipeline
         
         Args:
             api_key (str): CoinMarketCap API key
             use_sandbox (bool): Whether to use sandbox environment
+            cache_dir (str): Directory for the on-disk response cache, None to disable
+            cache_ttl (str | int): Cache tier name ('short', 'normal', 'long') or
+                lifetime in seconds; defaults to the endpoint's tier
+            max_records (int): Initial capacity of the append buffer
         """
         self.api_key = api_key or "ad7a73ca-faa9-4449-8c96-d7a6e83feba1"  # Your actual API key
         self.base_url = SANDBOX_URL if use_sandbox else BASE_URL
-        self.df = pd.DataFrame()
+        self._base = pd.DataFrame()  # data assigned to self.df, e.g. by load_from_csv
+        self._reset_buffer(max_records)
+        self._batch_times = []  # batch_id -> collection time
+        self._df = self._base  # materialized dataset, None when stale
+        self._by_name = {}  # coin name -> row positions in self.df
+        self._trend_cols_available = []  # TREND_COLS present in self.df
+        # Running aggregates behind get_summary_stats
+        self._name_counter = Counter()
+        self._ts_min = self._ts_max = None
+        self._stats_cache = None
+        self._stats_dirty = True
+        self._parquet_writer = None  # opened by save_append_parquet
+        self._figures = {}  # plot kind -> (Figure, Axes), reused across calls
         self.session = requests.Session()
         
+        # Larger keep-alive pool with retries on throttling/server errors
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.headers['Connection'] = 'keep-alive'
+        
         # Set up headers
         self.headers = {
             'Accepts': 'application/json',
@@ -41,12 +182,25 @@ class CryptoPipeline:
         }
         self.session.headers.update(self.headers)
         
+        # Async HTTP/2 client, only open while run_data_collection_async is running
+        self._http = None
+        
+        # Response cache
+        self._cache = diskcache.Cache(cache_dir) if cache_dir else None
+        if cache_ttl is None:
+            cache_ttl = next(
+                (tier for endpoint, tier in ENDPOINT_CACHE_TIERS.items()
+                 if self.base_url.endswith(endpoint)),
+                'normal'
+            )
+        self.cache_ttl = CACHE_TTL[cache_ttl] if isinstance(cache_ttl, str) else cache_ttl
+        
         # Set pandas display options
         pd.set_option('display.max_columns', None)
         pd.set_option('display.max_rows', None)
         pd.set_option('display.float_format', lambda x: '%.5f' % x)
     
-    def fetch_crypto_data(self, start=1, limit=15, convert='USD'):
+    def fetch_crypto_data(self, start=1, limit=15, convert='USD', use_cache=True):
         """
         Fetch cryptocurrency data from API
         
@@ -54,6 +208,8 @@ class CryptoPipeline:
             start (int): Starting rank
             limit (int): Number of cryptocurrencies to fetch
             convert (str): Currency to convert prices to
+            use_cache (bool): Whether a fresh cached response may be returned;
+                the response is cached for stale fallback either way
             
         Returns:
             dict: API response data or None if error
@@ -64,86 +220,162 @@ class CryptoPipeline:
             'convert': convert
         }
         
+        key = self._cache_key(parameters)
+        cached = self._cache_get(key) if use_cache else None
+        if cached is not None:
+            return cached
+        
         try:
             response = self.session.get(self.base_url, params=parameters)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
+            self._cache_store(key, data)
             return data
         except requests.exceptions.RequestException as e:
             print(f"API request failed: {e}")
-            # Return mock data for demonstration
-            return self._get_mock_data()
+            return self._fallback_data(key)
+        except json.JSONDecodeError as e:
+            print(f"Failed to parse JSON response: {e}")
+            return self._fallback_data(key)
+    
+    def fetch_crypto_data_parallel(self, pages, convert='USD', max_workers=8):
+        """
+        Fetch several pages at once from worker threads
+        
+        Blocking alternative to fetch_crypto_data_async for callers that
+        cannot run an event loop. The threads share self.session, so they
+        reuse its pooled keep-alive connections.
+        
+        Args:
+            pages (list[tuple[int, int]]): (start, limit) pair for each page
+            convert (str): Currency to convert prices to
+            max_workers (int): Maximum number of concurrent requests
+            
+        Returns:
+            list[dict]: API response data for each page, in the order given
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda page: self.fetch_crypto_data(start=page[0], limit=page[1], convert=convert),
+                pages
+            ))
+    
+    def _cache_key(self, parameters):
+        """Hash the endpoint and query parameters into a cache key"""
+        payload = orjson.dumps(
+            {'url': self.base_url, 'params': parameters},
+            option=orjson.OPT_SORT_KEYS
+        )
+        return hashlib.sha1(payload).hexdigest()
+    
+    def _cache_get(self, key):
+        """Return the cached response for key, or None on a miss"""
+        if self._cache is None:
+            return None
+        body = self._cache.get(key)
+        return orjson.loads(body) if body is not None else None
+    
+    def _cache_store(self, key, data):
+        """Cache a response, keeping a non-expiring copy for stale fallback"""
+        if self._cache is None:
+            return
+        body = orjson.dumps(data)
+        self._cache.set(key, body, expire=self.cache_ttl)
+        self._cache.set(('stale', key), body)
+    
+    def _fallback_data(self, key):
+        """Return the last good response for key, or mock data if there is none"""
+        stale = self._cache_get(('stale', key))
+        if stale is not None:
+            print("  - Using last cached response")
+            return stale
+        # Return mock data for demonstration
+        return self._get_mock_data()
+    
+    def _new_async_client(self):
+        """
+        Create an HTTP/2 client
+        
+        Concurrent requests are multiplexed over a single keep-alive TLS
+        connection instead of opening one connection per request.
+        """
+        return httpx.AsyncClient(
+            http2=True,
+            headers=self.headers,
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60)
+        )
+    
+    async def fetch_crypto_data_async(self, start=1, limit=15, convert='USD', use_cache=True):
+        """
+        Fetch cryptocurrency data from API without blocking the event loop
+        
+        Reuses the client opened by run_data_collection_async when there
+        is one, otherwise opens a short-lived client for this call.
+        
+        Args:
+            start (int): Starting rank
+            limit (int): Number of cryptocurrencies to fetch
+            convert (str): Currency to convert prices to
+            use_cache (bool): Whether a fresh cached response may be returned;
+                the response is cached for stale fallback either way
+            
+        Returns:
+            dict: API response data or None if error
+        """
+        if self._http is None or self._http.is_closed:
+            async with self._new_async_client() as client:
+                return await self._get_json_async(client, start, limit, convert, use_cache)
+        return await self._get_json_async(self._http, start, limit, convert, use_cache)
+    
+    async def _get_json_async(self, client, start, limit, convert, use_cache):
+        """Perform a single listings request on the given httpx client"""
+        parameters = {
+            'start': str(start),
+            'limit': str(limit),
+            'convert': convert
+        }
+        
+        key = self._cache_key(parameters)
+        # diskcache is blocking SQLite I/O, so keep it off the event loop
+        cached = await asyncio.to_thread(self._cache_get, key) if use_cache else None
+        if cached is not None:
+            return cached
+        
+        try:
+            response = await client.get(self.base_url, params=parameters)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            await asyncio.to_thread(self._cache_store, key, data)
+            return data
+        except httpx.HTTPError as e:
+            print(f"API request failed: {e}")
+            return await asyncio.to_thread(self._fallback_data, key)
         except json.JSONDecodeError as e:
             print(f"Failed to parse JSON response: {e}")
-            return self._get_mock_data()
+            return await asyncio.to_thread(self._fallback_data, key)
     
     def _get_mock_data(self):
         """Generate mock data for demonstration purposes"""
-        mock_data = {
-            'data': [
-                {
-                    'id': 1,
-                    'name': 'Bitcoin',
-                    'symbol': 'BTC',
-                    'slug': 'bitcoin',
-                    'cmc_rank': 1,
-                    'quote': {
-                        'USD': {
-                            'price': 45000.50 + np.random.normal(0, 1000),
-                            'percent_change_1h': np.random.normal(0, 2),
-                            'percent_change_24h': np.random.normal(0, 5),
-                            'percent_change_7d': np.random.normal(0, 10),
-                            'percent_change_30d': np.random.normal(0, 15),
-                            'percent_change_60d': np.random.normal(0, 20),
-                            'percent_change_90d': np.random.normal(0, 25),
-                            'market_cap': 800000000000,
-                            'volume_24h': 25000000000
-                        }
-                    }
-                },
-                {
-                    'id': 2,
-                    'name': 'Ethereum',
-                    'symbol': 'ETH',
-                    'slug': 'ethereum',
-                    'cmc_rank': 2,
-                    'quote': {
-                        'USD': {
-                            'price': 3200.75 + np.random.normal(0, 200),
-                            'percent_change_1h': np.random.normal(0, 2),
-                            'percent_change_24h': np.random.normal(0, 5),
-                            'percent_change_7d': np.random.normal(0, 10),
-                            'percent_change_30d': np.random.normal(0, 15),
-                            'percent_change_60d': np.random.normal(0, 20),
-                            'percent_change_90d': np.random.normal(0, 25),
-                            'market_cap': 400000000000,
-                            'volume_24h': 15000000000
-                        }
-                    }
-                },
-                {
-                    'id': 3,
-                    'name': 'Tether',
-                    'symbol': 'USDT',
-                    'slug': 'tether',
-                    'cmc_rank': 3,
-                    'quote': {
-                        'USD': {
-                            'price': 1.00 + np.random.normal(0, 0.01),
-                            'percent_change_1h': np.random.normal(0, 0.1),
-                            'percent_change_24h': np.random.normal(0, 0.2),
-                            'percent_change_7d': np.random.normal(0, 0.3),
-                            'percent_change_30d': np.random.normal(0, 0.5),
-                            'percent_change_60d': np.random.normal(0, 0.7),
-                            'percent_change_90d': np.random.normal(0, 1.0),
-                            'market_cap': 90000000000,
-                            'volume_24h': 50000000000
-                        }
-                    }
-                }
-            ]
-        }
-        return mock_data
+        # Draw all price and percent-change noise in two vectorized calls
+        prices = _MOCK_BASE_PRICES + np.random.normal(0, _MOCK_PRICE_STDS)
+        pct = np.random.normal(_MOCK_MEANS, _MOCK_STDS)
+        
+        data = []
+        for i, (coin_id, name, symbol, slug, market_cap, volume) in enumerate(_MOCK_COINS):
+            quote = {'price': float(prices[i])}
+            quote.update(zip(_MOCK_PCT_STDS, pct[i].tolist()))
+            quote['market_cap'] = market_cap
+            quote['volume_24h'] = volume
+            data.append({
+                'id': coin_id,
+                'name': name,
+                'symbol': symbol,
+                'slug': slug,
+                'cmc_rank': i + 1,
+                'quote': {'USD': quote}
+            })
+        
+        return {'data': data}
     
     def process_data(self, data):
         """
@@ -153,69 +385,478 @@ class CryptoPipeline:
             data (dict): Raw API response data
             
         Returns:
-            pd.DataFrame: Processed cryptocurrency data
+            pd.DataFrame: Processed cryptocurrency data, with the collection
+                time in attrs['batch_time']
         """
-        if not data or 'data' not in data:
+        if not data or not data.get('data'):
             return pd.DataFrame()
         
-        # Normalize the JSON data
-        df_new = pd.json_normalize(data['data'])
+        # Build one array per column straight from the fixed schema
+        rows = data['data']
+        columns = self._extract_columns(rows)
+        # Convert straight to the compact dtypes; None (missing value)
+        # becomes NaN or NA
+        for col, dtype in COLUMN_DTYPES.items():
+            if col in MASKED_INT_DTYPES:
+                columns[col] = pd.array(columns[col], dtype=dtype)
+            else:
+                columns[col] = np.array(columns[col], dtype=dtype)
         
-        # Add timestamp
-        df_new['timestamp'] = pd.to_datetime('now')
+        df_new = pd.DataFrame(columns, copy=False)
+        # One collection time for the whole batch rather than a column of
+        # copies; with_timestamps adds the column when it is needed
+        df_new.attrs['batch_time'] = np.datetime64(datetime.now(), 'ns')
         
         return df_new
     
+    @staticmethod
+    def _extract_columns(rows):
+        """Pull the schema fields out of listing entries as one list per column"""
+        columns = {field: [r.get(field) for r in rows] for field in LISTING_FIELDS}
+        quotes = [r.get('quote', {}).get('USD', {}) for r in rows]
+        for field in QUOTE_FIELDS:
+            columns[f'quote.USD.{field}'] = [q.get(field) for q in quotes]
+        return columns
+    
+    def _to_record_batch(self, data):
+        """
+        Convert raw API data into an Arrow record batch without pandas
+        
+        Args:
+            data (dict): Raw API response data
+            
+        Returns:
+            pa.RecordBatch: Batch in PARQUET_SCHEMA, or None if there is no data
+        """
+        if not data or not data.get('data'):
+            return None
+        
+        rows = data['data']
+        columns = self._extract_columns(rows)
+        ts = np.datetime64(datetime.now(), 'ns')
+        columns['timestamp'] = np.full(len(rows), ts, dtype='datetime64[ns]')
+        
+        arrays = [pa.array(columns[field.name], type=field.type) for field in PARQUET_SCHEMA]
+        return pa.RecordBatch.from_arrays(arrays, schema=PARQUET_SCHEMA)
+    
+    @property
+    def df(self):
+        """
+        Full dataset
+        
+        Rows live in pre-allocated column arrays. The first read after an
+        append wraps views of them in a new frame without copying or
+        converting data: numbers are used as stored, and name, symbol and
+        slug are categoricals over the codes kept by append_data (so
+        groupby works on integer codes). Rows carry the batch_id of their
+        collection time instead of a timestamp; see with_timestamps.
+        
+        Frames assigned to self.df are copied into the buffer when they
+        have its columns. Other frames are kept as they are, and every read
+        after an append then concatenates the whole dataset.
+        """
+        if self._df is None:
+            columns = {}
+            for col in BUFFER_DTYPES:
+                values = self._buf[col][:self._n]
+                if col in MASKED_INT_DTYPES:
+                    columns[col] = pd.arrays.IntegerArray(values, self._buf[f'{col}.isna'][:self._n])
+                elif col in STRING_FIELDS:
+                    dtype = self._category_dtypes.get(col)
+                    if dtype is None:
+                        dtype = pd.CategoricalDtype(list(self._categories[col]))
+                        self._category_dtypes[col] = dtype
+                    columns[col] = pd.Categorical.from_codes(values, dtype=dtype, validate=False)
+                else:
+                    columns[col] = values
+            appended = pd.DataFrame(columns, copy=False)
+            if not self._base.empty:
+                appended = self._encode_strings(pd.concat([self._base, appended], ignore_index=True))
+            self._df = appended
+        return self._df
+    
+    @df.setter
+    def df(self, value):
+        # Re-encode collection times as batch ids into a new batch table
+        value = self.with_timestamps(value)
+        self._batch_times = []
+        self._ts_min = self._ts_max = None
+        batch_ids = self._batch_ids(value)
+        if batch_ids is not None:
+            value = value.drop(columns='timestamp').assign(batch_id=batch_ids.astype('int32'))
+        
+        self._reset_buffer(len(self._buf['id']))
+        columns = self._buffer_columns(value)
+        if columns is not None:
+            self._base = pd.DataFrame()
+            self._write_buffer(columns)
+            self._df = None
+        else:
+            self._base = self._encode_strings(value)
+            self._df = self._base
+        
+        self._trend_cols_available = [col for col in TREND_COLS if col in self.df.columns]
+        self._by_name = {}
+        self._name_counter = Counter()
+        if 'name' in self.df.columns:
+            self._index_names(self.df['name'], 0)
+        self._stats_dirty = True
+    
+    def with_timestamps(self, frame=None):
+        """
+        Add a timestamp column to a frame
+        
+        Timestamps are only materialized where they are needed, such as
+        plotting and saving. Batch ids refer to this pipeline's own
+        collection times.
+        
+        Args:
+            frame (pd.DataFrame): Rows of self.df, or a batch from
+                process_data; defaults to the full dataset
+            
+        Returns:
+            pd.DataFrame: Copy of frame with its batch_id column (or
+                attrs['batch_time']) replaced by a timestamp column
+        """
+        if frame is None:
+            frame = self.df
+        if 'batch_id' in frame.columns:
+            ids = frame['batch_id'].to_numpy(dtype=np.int64, na_value=-1)
+            timestamps = pd.DatetimeIndex(self._batch_times).take(
+                ids, allow_fill=True, fill_value=pd.NaT
+            )
+            return frame.drop(columns='batch_id').assign(timestamp=timestamps)
+        if 'batch_time' in frame.attrs and 'timestamp' not in frame.columns:
+            frame = frame.assign(timestamp=frame.attrs['batch_time'])
+            del frame.attrs['batch_time']  # now held by the column
+        return frame
+    
+    def _add_batch_times(self, times):
+        """Register collection times as the next batch ids, returning the first id"""
+        index = pd.DatetimeIndex(times)
+        first = len(self._batch_times)
+        self._batch_times.extend(index)
+        batch_min, batch_max = index.min(), index.max()
+        if pd.notna(batch_min):
+            self._ts_min = batch_min if self._ts_min is None else min(self._ts_min, batch_min)
+            self._ts_max = batch_max if self._ts_max is None else max(self._ts_max, batch_max)
+        return first
+    
+    def _batch_ids(self, frame):
+        """
+        Register the collection times of a frame's rows
+        
+        Returns:
+            np.ndarray | int: Batch id of each row, or of the whole frame
+                when it came from process_data; None if frame has no times
+                or already holds batch ids
+        """
+        if 'timestamp' in frame.columns:
+            codes, times = pd.factorize(frame['timestamp'], use_na_sentinel=False)
+            return codes + self._add_batch_times(times)
+        if 'batch_time' in frame.attrs and 'batch_id' not in frame.columns:
+            return self._add_batch_times([frame.attrs['batch_time']])
+        return None
+    
+    @staticmethod
+    def _encode_strings(df):
+        """
+        Return a copy of df with its text columns converted to categoricals
+        
+        Categories are kept in order of first appearance, as in the append
+        buffer, rather than sorted.
+        """
+        return df.assign(**{
+            col: pd.Categorical(df[col], categories=df[col].dropna().unique().tolist())
+            for col in STRING_FIELDS if col in df.columns
+        })
+    
+    def _reset_buffer(self, capacity):
+        """Start an empty append buffer; frames built earlier keep views of the old one"""
+        self._buf = self._allocate_buffer(capacity)
+        self._n = 0  # rows used in self._buf
+        self._categories = {col: {} for col in STRING_FIELDS}  # value -> code, per text column
+        self._category_dtypes = {}  # CategoricalDtype per text column, until it gains values
+    
+    @staticmethod
+    def _allocate_buffer(capacity):
+        """Create empty append-buffer arrays, plus null masks, holding `capacity` rows"""
+        buf = {col: np.empty(capacity, dtype=dtype) for col, dtype in BUFFER_DTYPES.items()}
+        for col in MASKED_INT_DTYPES:
+            buf[f'{col}.isna'] = np.empty(capacity, dtype=bool)
+        return buf
+    
+    @staticmethod
+    def _code_dtype(n_categories):
+        """Code width pandas uses for n categories, so from_codes keeps the buffer as is"""
+        for dtype in (np.int8, np.int16, np.int32):
+            if n_categories < np.iinfo(dtype).max:
+                return dtype
+        return np.int64
+    
+    def _encode(self, col, values):
+        """
+        Map values to codes in the category list of a coded column
+        
+        New values are added to the end of the list, widening the buffer's
+        code array when needed. Missing values get code -1.
+        """
+        codes, uniques = pd.factorize(values)
+        table = self._categories[col]
+        size = len(table)
+        lookup = np.array([table.setdefault(value, len(table)) for value in uniques] + [-1])
+        if len(table) > size:
+            self._category_dtypes.pop(col, None)
+        dtype = self._code_dtype(len(table))
+        if self._buf[col].dtype != dtype:
+            self._buf[col] = self._buf[col].astype(dtype)
+        return lookup[codes]
+    
+    def _record_count(self):
+        """Number of records, without materializing the dataset"""
+        return len(self._base) + self._n
+    
+    def _reserve(self, extra):
+        """Grow the append buffer so it holds at least `extra` more rows"""
+        capacity = len(self._buf['id'])
+        needed = self._n + extra
+        if needed <= capacity:
+            return
+        capacity = max(needed, 2 * capacity)
+        for col, arr in self._buf.items():
+            grown = np.empty(capacity, dtype=arr.dtype)
+            grown[:self._n] = arr[:self._n]
+            self._buf[col] = grown
+    
+    @staticmethod
+    def _buffer_columns(frame):
+        """
+        Convert a frame to the buffer's column types
+        
+        Returns:
+            dict: Buffer column -> values, with text columns left for
+                _write_buffer to encode; None when frame has other columns
+                than the buffer, no collection times, or values of another
+                type. No pipeline state is changed either way.
+        """
+        has_times = 'timestamp' in frame.columns or 'batch_id' in frame.columns or 'batch_time' in frame.attrs
+        schema = set(BUFFER_DTYPES) - {'batch_id'}
+        if not has_times or not schema <= set(frame.columns) <= schema | {'timestamp', 'batch_id'}:
+            return None
+        
+        columns = {}
+        try:
+            for col, dtype in BUFFER_DTYPES.items():
+                if col not in frame.columns:
+                    continue
+                values = frame[col]
+                if col in MASKED_INT_DTYPES:
+                    columns[f'{col}.isna'] = values.isna().to_numpy()
+                    columns[col] = values.to_numpy(dtype=dtype, na_value=0)
+                elif col in STRING_FIELDS:
+                    columns[col] = values
+                else:
+                    columns[col] = values.to_numpy(dtype=dtype)
+        except (TypeError, ValueError):
+            return None
+        return columns
+    
+    def _write_buffer(self, columns):
+        """Copy columns from _buffer_columns, plus batch ids, into the next rows of the buffer"""
+        m = len(columns['id'])
+        self._reserve(m)
+        rows = slice(self._n, self._n + m)
+        for col, values in columns.items():
+            if col in STRING_FIELDS:
+                values = self._encode(col, values)
+            self._buf[col][rows] = values
+        self._n += m
+    
+    def _append_to_base(self, frame):
+        """
+        Append a frame that does not fit the buffer by concatenation
+        
+        Every column of frame is kept. The buffered rows move into _base
+        with it, so reads are O(n) again until self.df is reassigned.
+        """
+        batch_ids = self._batch_ids(frame)
+        if batch_ids is not None:
+            frame = frame.drop(columns='timestamp', errors='ignore').assign(batch_id=batch_ids)
+        self._base = self._encode_strings(pd.concat([self.df, frame], ignore_index=True))
+        self._reset_buffer(len(self._buf['id']))
+        self._df = self._base
+    
     def append_data(self, new_data):
         """
         Append new data to the existing dataset
         
+        Frames with other columns than process_data output, or values that
+        do not convert to its dtypes, are concatenated with the dataset
+        instead of going through the append buffer.
+        
         Args:
-            new_data (pd.DataFrame): New cryptocurrency data
+            new_data (pd.DataFrame): New cryptocurrency data, as returned by
+                process_data
         """
         if new_data.empty:
             return
         
-        if self.df.empty:
-            self.df = new_data.copy()
+        start = self._record_count()
+        columns = self._buffer_columns(new_data)
+        if columns is None:
+            self._append_to_base(new_data)
         else:
-            # Use concat instead of deprecated append
-            self.df = pd.concat([self.df, new_data], ignore_index=True)
+            # Store the batch's collection time once, and its id on every row
+            batch_ids = self._batch_ids(new_data)
+            if batch_ids is not None:
+                columns['batch_id'] = batch_ids
+            self._write_buffer(columns)
+            self._df = None
+        
+        self._trend_cols_available = [
+            col for col in TREND_COLS
+            if col in self._trend_cols_available or col in new_data.columns
+        ]
+        
+        # Update the name index and running aggregates from this batch only
+        if 'name' in new_data.columns:
+            self._index_names(new_data['name'], start)
+        self._stats_dirty = True
     
-    def run_data_collection(self, iterations=5, sleep_interval=10):
+    def _index_names(self, names, start):
         """
-        Run automated data collection
+        Add rows to the name index and name counts
+        
+        Names are visited in order of first appearance, so most_common
+        breaks ties the way value_counts does. Missing names are skipped.
+        
+        Args:
+            names (pd.Series): Coin name of each row
+            start (int): Position of the first row in self.df
+        """
+        codes, uniques = pd.factorize(names)
+        order = np.argsort(codes, kind='stable')
+        bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+        for code, name in enumerate(uniques):
+            rows = order[bounds[code]:bounds[code + 1]] + start
+            self._by_name.setdefault(name, []).extend(rows.tolist())
+            self._name_counter[name] += len(rows)
+    
+    async def run_data_collection_async(self, iterations=5, sleep_interval=10, pages=1, limit=15):
+        """
+        Run automated data collection on the event loop
+        
+        Each iteration fetches `pages` consecutive pages of `limit` coins
+        concurrently over a shared HTTP/2 connection. Fetched pages are
+        processed in worker threads while the loop sleeps; finished batches
+        are appended in collection order at the start of each iteration.
         
         Args:
             iterations (int): Number of data collection iterations
             sleep_interval (int): Sleep time between iterations (seconds)
+            pages (int): Number of pages fetched concurrently per iteration
+            limit (int): Number of cryptocurrencies per page
         """
         print(f"Starting automated data collection for {iterations} iterations...")
         
-        for i in range(iterations):
-            print(f"Iteration {i+1}/{iterations}")
-            
-            # Fetch data
-            raw_data = self.fetch_crypto_data()
-            
-            if raw_data:
-                # Process data
-                processed_data = self.process_data(raw_data)
-                
-                # Append to dataset
-                self.append_data(processed_data)
-                
-                print(f"  - Collected data for {len(processed_data)} cryptocurrencies")
-                print(f"  - Total dataset size: {len(self.df)} records")
-            else:
-                print("  - Failed to collect data")
-            
-            if i < iterations - 1:  # Don't sleep after the last iteration
-                print(f"  - Sleeping for {sleep_interval} seconds...")
-                time.sleep(sleep_interval)
+        processing_tasks = []
+        self._reserve(iterations * pages * limit)
+        
+        async with self._new_async_client() as client:
+            self._http = client
+            try:
+                for i in range(iterations):
+                    print(f"Iteration {i+1}/{iterations}")
+                    self._append_processed(processing_tasks)
+                    
+                    # Fetch all pages concurrently
+                    tasks = [
+                        # Every iteration needs a live snapshot, not a cached one
+                        self.fetch_crypto_data_async(start=page * limit + 1, limit=limit, use_cache=False)
+                        for page in range(pages)
+                    ]
+                    results = await asyncio.gather(*tasks)
+                    
+                    collected = 0
+                    for raw_data in results:
+                        if raw_data:
+                            # Process data off the event loop, overlapping the sleep
+                            processing_tasks.append(asyncio.create_task(
+                                asyncio.to_thread(self.process_data, raw_data)
+                            ))
+                            collected += len(raw_data.get('data') or [])
+                    
+                    if collected:
+                        print(f"  - Collected data for {collected} cryptocurrencies")
+                        print(f"  - Total dataset size: {self._record_count()} records "
+                              f"({len(processing_tasks)} batches processing)")
+                    else:
+                        print("  - Failed to collect data")
+                    
+                    if i < iterations - 1:  # Don't sleep after the last iteration
+                        print(f"  - Sleeping for {sleep_interval} seconds...")
+                        await asyncio.sleep(sleep_interval)
+            finally:
+                self._http = None
+                # Keep every batch that finished, even if the run was interrupted
+                self._append_processed(processing_tasks)
+        
+        if processing_tasks:
+            await asyncio.wait(processing_tasks)
+            self._append_processed(processing_tasks)
         
         print("Data collection completed!")
     
+    def _append_processed(self, tasks):
+        """
+        Append the results of finished processing tasks, in order
+        
+        Stops at the first task still running so batches keep collection
+        order. A task that failed is reported and skipped.
+        
+        Args:
+            tasks (list[asyncio.Task]): Pending process_data tasks, oldest first
+        """
+        while tasks and tasks[0].done():
+            task = tasks.pop(0)
+            if task.cancelled():
+                continue
+            if task.exception() is not None:
+                print(f"  - Failed to process batch: {task.exception()}")
+            else:
+                self.append_data(task.result())
+    
+    def run_data_collection(self, iterations=5, sleep_interval=10, pages=1, limit=15):
+        """
+        Run automated data collection
+        
+        Blocking wrapper around run_data_collection_async. Inside a running
+        event loop (e.g. Jupyter) asyncio.run is not allowed, so the run gets
+        its own loop on a worker thread; awaiting the async version directly
+        is preferable there.
+        
+        Args:
+            iterations (int): Number of data collection iterations
+            sleep_interval (int): Sleep time between iterations (seconds)
+            pages (int): Number of pages fetched concurrently per iteration
+            limit (int): Number of cryptocurrencies per page
+        """
+        def run():
+            asyncio.run(self.run_data_collection_async(
+                iterations=iterations,
+                sleep_interval=sleep_interval,
+                pages=pages,
+                limit=limit
+            ))
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            run()
+            return
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(run).result()
+    
     def save_to_csv(self, filename='crypto_data.csv'):
         """
         Save data to CSV file
@@ -228,7 +869,7 @@ class CryptoPipeline:
             return
         
         filepath = Path(filename)
-        self.df.to_csv(filepath, index=False)
+        self.with_timestamps().to_csv(filepath, index=False)
         print(f"Data saved to {filepath.absolute()}")
     
     def load_from_csv(self, filename='crypto_data.csv'):
@@ -240,8 +881,108 @@ class CryptoPipeline:
         """
         filepath = Path(filename)
         if filepath.exists():
-            self.df = pd.read_csv(filepath)
-            self.df['timestamp'] = pd.to_datetime(self.df['timestamp'])
+            df = pd.read_csv(filepath, dtype=COLUMN_DTYPES)
+            # Timestamps are written by to_csv in ISO 8601, so skip format inference
+            df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601', cache=True)
+            self.df = df
+            print(f"Data loaded from {filepath.absolute()}")
+            print(f"Dataset shape: {self.df.shape}")
+        else:
+            print(f"File {filepath.absolute()} not found")
+    
+    def fetch_to_parquet_streaming(self, filename='crypto_data.parquet', iterations=5,
+                                   sleep_interval=10, start=1, limit=15):
+        """
+        Collect data straight into a Parquet file
+        
+        Fast path for fetch-and-save runs: each response is written as a row
+        group from the parsed JSON without building a DataFrame, and
+        nothing is added to self.df.
+        
+        Args:
+            filename (str): Output filename
+            iterations (int): Number of data collection iterations
+            sleep_interval (int): Sleep time between iterations (seconds)
+            start (int): Starting rank
+            limit (int): Number of cryptocurrencies to fetch
+        """
+        filepath = Path(filename).with_suffix('.parquet')
+        print(f"Streaming {iterations} iterations to {filepath.absolute()}...")
+        
+        with pq.ParquetWriter(filepath, PARQUET_SCHEMA, compression='zstd') as writer:
+            for i in range(iterations):
+                raw_data = self.fetch_crypto_data(start=start, limit=limit, use_cache=False)
+                batch = self._to_record_batch(raw_data)
+                
+                if batch is not None:
+                    writer.write_batch(batch)
+                    print(f"  - Iteration {i+1}/{iterations}: wrote {batch.num_rows} records")
+                else:
+                    print(f"  - Iteration {i+1}/{iterations}: failed to collect data")
+                
+                if i < iterations - 1:  # Don't sleep after the last iteration
+                    time.sleep(sleep_interval)
+        
+        print("Data collection completed!")
+    
+    def save_to_parquet(self, filename='crypto_data.parquet'):
+        """
+        Save data to a zstd-compressed Parquet file
+        
+        Args:
+            filename (str): Output filename
+        """
+        if self.df.empty:
+            print("No data to save")
+            return
+        
+        filepath = Path(filename).with_suffix('.parquet')
+        self.with_timestamps().to_parquet(filepath, engine='pyarrow', compression='zstd', index=False)
+        print(f"Data saved to {filepath.absolute()}")
+    
+    def save_append_parquet(self, new_data, filename='crypto_data.parquet'):
+        """
+        Append a batch to a Parquet file as a new row group
+        
+        The writer is opened on the first call and kept open, so earlier
+        batches are never rewritten. Call close_parquet_writer when done.
+        
+        Args:
+            new_data (pd.DataFrame): New cryptocurrency data
+            filename (str): Output filename, only used on the first call
+        """
+        if new_data.empty:
+            return
+        
+        new_data = self.with_timestamps(new_data)
+        if self._parquet_writer is None:
+            table = pa.Table.from_pandas(new_data, preserve_index=False)
+            filepath = Path(filename).with_suffix('.parquet')
+            self._parquet_writer = pq.ParquetWriter(filepath, table.schema, compression='zstd')
+        else:
+            table = pa.Table.from_pandas(
+                new_data, schema=self._parquet_writer.schema, preserve_index=False
+            )
+        self._parquet_writer.write_table(table)
+    
+    def close_parquet_writer(self):
+        """Finish the file written by save_append_parquet"""
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+    
+    def load_from_parquet(self, filename='crypto_data.parquet'):
+        """
+        Load data from Parquet file
+        
+        Args:
+            filename (str): Input filename
+        """
+        filepath = Path(filename).with_suffix('.parquet')
+        if filepath.exists():
+            df = pd.read_parquet(filepath, engine='pyarrow')
+            # Integer columns with nulls come back as float without pandas metadata
+            self.df = df.astype({col: dtype for col, dtype in COLUMN_DTYPES.items() if col in df.columns})
             print(f"Data loaded from {filepath.absolute()}")
             print(f"Dataset shape: {self.df.shape}")
         else:
@@ -252,38 +993,48 @@ class CryptoPipeline:
         Analyze cryptocurrency price trends over time
         
         Returns:
-            pd.DataFrame: Aggregated trend analysis
+            pd.DataFrame: Aggregated trend analysis, one column per time
+                period labelled '1h', '24h', ... '90d'
         """
         if self.df.empty:
             print("No data available for analysis")
             return pd.DataFrame()
         
         # Calculate mean percentage changes by cryptocurrency
-        trend_columns = [
-            'quote.USD.percent_change_1h',
-            'quote.USD.percent_change_24h', 
-            'quote.USD.percent_change_7d',
-            'quote.USD.percent_change_30d',
-            'quote.USD.percent_change_60d',
-            'quote.USD.percent_change_90d'
-        ]
-        
-        available_columns = [col for col in trend_columns if col in self.df.columns]
+        available_columns = self._trend_cols_available
         
         if not available_columns:
             print("No trend data available")
             return pd.DataFrame()
         
-        trend_analysis = self.df.groupby('name', sort=False)[available_columns].mean()
+        trend_analysis = self.df.groupby('name', sort=False, observed=True)[available_columns].mean()
+        trend_analysis = trend_analysis.rename(columns=TREND_LABELS)
         
         return trend_analysis
     
-    def visualize_trends(self, save_plot=False):
+    def _get_axes(self, kind, figsize):
+        """
+        Return the cached figure and cleared axes for a plot kind
+        
+        A new figure is only created on first use or after the previous one
+        was closed.
+        """
+        fig, ax = self._figures.get(kind, (None, None))
+        if fig is None or not plt.fignum_exists(fig.number):
+            fig, ax = plt.subplots(figsize=figsize)
+            self._figures[kind] = (fig, ax)
+        else:
+            ax.clear()
+        return fig, ax
+    
+    def visualize_trends(self, save_plot=False, show=True):
         """
         Create visualizations of cryptocurrency trends
         
         Args:
             save_plot (bool): Whether to save the plot to file
+            show (bool): Whether to display the plot; when False the figure
+                is closed after saving
         """
         if self.df.empty:
             print("No data available for visualization")
@@ -303,14 +1054,16 @@ class CryptoPipeline:
             value_name='percent_change'
         )
         
-        # Clean up time period labels
-        trend_melted['time_period'] = trend_melted['time_period'].str.replace(
-            'quote.USD.percent_change_', ''
+        # Keep time periods in chronological rather than string order
+        trend_melted['time_period'] = pd.Categorical(
+            trend_melted['time_period'],
+            categories=list(trend_data.columns),
+            ordered=True
         )
         
         # Create the plot
-        plt.figure(figsize=(12, 8))
         sns.set_theme(style="whitegrid")
+        fig, ax = self._get_axes('trends', figsize=(12, 8))
         
         # Line plot showing trends
         sns.lineplot(
@@ -318,85 +1071,107 @@ class CryptoPipeline:
             x='time_period', 
             y='percent_change', 
             hue='name',
-            marker='o'
+            marker='o',
+            ax=ax
         )
         
-        plt.title('Cryptocurrency Price Change Trends Over Time')
-        plt.xlabel('Time Period')
-        plt.ylabel('Average Percent Change (%)')
-        plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-        plt.xticks(rotation=45)
-        plt.tight_layout()
+        ax.set_title('Cryptocurrency Price Change Trends Over Time')
+        ax.set_xlabel('Time Period')
+        ax.set_ylabel('Average Percent Change (%)')
+        ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+        ax.tick_params(axis='x', labelrotation=45)
+        fig.tight_layout()
         
         if save_plot:
-            plt.savefig('crypto_trends.png', dpi=300, bbox_inches='tight')
+            fig.savefig('crypto_trends.png', dpi=300, bbox_inches='tight')
             print("Plot saved as 'crypto_trends.png'")
         
-        plt.show()
+        self._show_or_close(fig, show)
     
-    def visualize_bitcoin_price(self, save_plot=False):
+    def visualize_bitcoin_price(self, save_plot=False, show=True):
         """
         Visualize Bitcoin price over time
         
         Args:
             save_plot (bool): Whether to save the plot to file
+            show (bool): Whether to display the plot; when False the figure
+                is closed after saving
         """
         if self.df.empty:
             print("No data available for visualization")
             return
         
-        # Filter for Bitcoin data
-        bitcoin_data = self.df[self.df['name'] == 'Bitcoin'].copy()
+        # Look up Bitcoin rows in the name index rather than scanning the column
+        bitcoin_data = self.with_timestamps(self.df.iloc[self._by_name.get('Bitcoin', [])])
         
         if bitcoin_data.empty:
             print("No Bitcoin data available")
             return
         
         # Create price timeline plot
-        plt.figure(figsize=(12, 6))
         sns.set_theme(style="darkgrid")
+        fig, ax = self._get_axes('bitcoin_price', figsize=(12, 6))
         
         sns.lineplot(
             data=bitcoin_data, 
             x='timestamp', 
             y='quote.USD.price',
             linewidth=2,
-            color='orange'
+            color='orange',
+            ax=ax
         )
         
-        plt.title('Bitcoin Price Over Time', fontsize=16, fontweight='bold')
-        plt.xlabel('Timestamp')
-        plt.ylabel('Price (USD)')
-        plt.xticks(rotation=45)
-        plt.tight_layout()
+        ax.set_title('Bitcoin Price Over Time', fontsize=16, fontweight='bold')
+        ax.set_xlabel('Timestamp')
+        ax.set_ylabel('Price (USD)')
+        ax.tick_params(axis='x', labelrotation=45)
+        fig.tight_layout()
         
         if save_plot:
-            plt.savefig('bitcoin_price.png', dpi=300, bbox_inches='tight')
+            fig.savefig('bitcoin_price.png', dpi=300, bbox_inches='tight')
             print("Plot saved as 'bitcoin_price.png'")
         
-        plt.show()
+        self._show_or_close(fig, show)
+    
+    @staticmethod
+    def _show_or_close(fig, show):
+        """Display a reused figure, or release it when it was only saved"""
+        if show:
+            fig.canvas.draw_idle()
+            plt.show()
+        else:
+            plt.close(fig)
     
     def get_summary_stats(self):
         """
         Get summary statistics of the dataset
         
+        Built from running aggregates kept by append_data and cached until
+        the next change, so repeated calls do not rescan the dataset. Each
+        call returns its own copy.
+        
         Returns:
             dict: Summary statistics
         """
-        if self.df.empty:
-            return {"message": "No data available"}
-        
-        stats = {
-            "total_records": len(self.df),
-            "unique_cryptocurrencies": self.df['name'].nunique() if 'name' in self.df.columns else 0,
-            "data_collection_period": {
-                "start": self.df['timestamp'].min().strftime('%Y-%m-%d %H:%M:%S') if 'timestamp' in self.df.columns else "N/A",
-                "end": self.df['timestamp'].max().strftime('%Y-%m-%d %H:%M:%S') if 'timestamp' in self.df.columns else "N/A"
-            },
-            "top_cryptocurrencies": self.df['name'].value_counts().head().to_dict() if 'name' in self.df.columns else {}
-        }
+        if not self._stats_dirty:
+            return copy.deepcopy(self._stats_cache)
+        
+        if self._record_count() == 0:
+            stats = {"message": "No data available"}
+        else:
+            stats = {
+                "total_records": self._record_count(),
+                "unique_cryptocurrencies": len(self._name_counter),
+                "data_collection_period": {
+                    "start": self._ts_min.strftime('%Y-%m-%d %H:%M:%S') if self._ts_min is not None else "N/A",
+                    "end": self._ts_max.strftime('%Y-%m-%d %H:%M:%S') if self._ts_max is not None else "N/A"
+                },
+                "top_cryptocurrencies": dict(self._name_counter.most_common(5))
+            }
         
-        return stats
+        self._stats_cache = stats
+        self._stats_dirty = False
+        return copy.deepcopy(stats)
 
 
 def main():
@@ -421,7 +1196,8 @@ def main():
     
     print("\n3. Sample data:")
     if not pipeline.df.empty:
-        print(pipeline.df[['name', 'symbol', 'quote.USD.price', 'timestamp']].head(10))
+        sample = pipeline.with_timestamps(pipeline.df.head(10))
+        print(sample[['name', 'symbol', 'quote.USD.price', 'timestamp']])
     
     print("\n4. Analyzing price trends...")
     trend_analysis = pipeline.analyze_price_trends()
@@ -436,13 +1212,13 @@ def main():
     # Create Bitcoin price visualization
     pipeline.visualize_bitcoin_price(save_plot=True)
     
-    print("\n6. Saving data to CSV...")
-    pipeline.save_to_csv('crypto_pipeline_demo_data.csv')
+    print("\n6. Saving data to Parquet...")
+    pipeline.save_to_parquet('crypto_pipeline_demo_data.parquet')
     
     print("\n" + "=" * 60)
     print("Demonstration completed successfully!")
     print("Generated files:")
-    print("  - crypto_pipeline_demo_data.csv (dataset)")
+    print("  - crypto_pipeline_demo_data.parquet (dataset)")
     print("  - crypto_trends.png (trend analysis plot)")
     print("  - bitcoin_price.png (Bitcoin price plot)")
     print("=" * 60)